@@ -365,12 +365,14 @@ impl Database {
     }
 
     pub async fn get_recent_requests(&self, agent_id: Option<&str>, limit: i64) -> Result<Vec<(String, TrafficEvent, Option<i32>)>, sqlx::Error> {
-        self.get_recent_requests_paginated(agent_id, limit, 0).await
+        self.get_recent_requests_paginated(agent_id, None, None, limit, 0).await
     }
 
     pub async fn get_recent_requests_paginated(
         &self, 
         agent_id: Option<&str>, 
+        url_contains: Option<&str>,
+        since: Option<i64>,
         limit: i64, 
         offset: i64
     ) -> Result<Vec<(String, TrafficEvent, Option<i32>)>, sqlx::Error> {
@@ -379,22 +381,40 @@ impl Database {
              Err(_) => return Ok(Vec::new()),
         };
 
-        let query = if let Some(aid) = agent_id {
-            sqlx::query(
-                "SELECT request_id, agent_id, req_method, req_url, req_headers, req_body, tls_info, res_status FROM http_transactions WHERE agent_id = ? ORDER BY req_timestamp DESC LIMIT ? OFFSET ?"
-            )
-            .bind(aid)
-            .bind(limit)
-            .bind(offset)
+        // Filters are pushed into SQL so only matching rows leave the database.
+        // instr() is used for substring match to avoid LIKE wildcard escaping.
+        let mut conditions = Vec::new();
+        if agent_id.is_some() {
+            conditions.push("agent_id = ?");
+        }
+        if url_contains.is_some() {
+            conditions.push("instr(req_url, ?) > 0");
+        }
+        if since.is_some() {
+            conditions.push("req_timestamp >= ?");
+        }
+        let where_clause = if conditions.is_empty() {
+            String::new()
         } else {
-            sqlx::query(
-                "SELECT request_id, agent_id, req_method, req_url, req_headers, req_body, tls_info, res_status FROM http_transactions ORDER BY req_timestamp DESC LIMIT ? OFFSET ?"
-            )
-            .bind(limit)
-            .bind(offset)
+            format!(" WHERE {}", conditions.join(" AND "))
         };
+        let sql = format!(
+            "SELECT request_id, agent_id, req_method, req_url, req_headers, req_body, tls_info, res_status FROM http_transactions{} ORDER BY req_timestamp DESC LIMIT ? OFFSET ?",
+            where_clause
+        );
+
+        let mut query = sqlx::query(&sql);
+        if let Some(aid) = agent_id {
+            query = query.bind(aid);
+        }
+        if let Some(pattern) = url_contains {
+            query = query.bind(pattern);
+        }
+        if let Some(ts) = since {
+            query = query.bind(ts);
+        }
 
-        let rows = query.fetch_all(&pool).await?;
+        let rows = query.bind(limit).bind(offset).fetch_all(&pool).await?;
 
         let mut results = Vec::new();
         for row in rows {
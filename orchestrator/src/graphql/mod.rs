@@ -45,6 +45,8 @@ impl QueryRoot {
         &self, 
         ctx: &Context<'_>,
         agent_id: Option<String>,
+        url_contains: Option<String>,
+        since: Option<i64>,
         limit: Option<i32>,
         offset: Option<i32>,
     ) -> async_graphql::Result<Vec<TrafficEventGql>> {
@@ -53,7 +55,7 @@ impl QueryRoot {
         let offset = offset.unwrap_or(0) as i64;
         
         let events = db
-            .get_recent_requests_paginated(agent_id.as_deref(), limit, offset)
+            .get_recent_requests_paginated(agent_id.as_deref(), url_contains.as_deref(), since, limit, offset)
             .await
             .map_err(|e| async_graphql::Error::new(e.to_string()))?;
 
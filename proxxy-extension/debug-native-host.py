@@ -11,6 +11,23 @@ import threading
 import time
 import os
 
+# Native messaging length prefix: 32-bit unsigned, native byte order
+_LEN = struct.Struct('=I')
+
+try:
+    import msgspec
+    _ENC = msgspec.json.Encoder()
+    _DEC = msgspec.json.Decoder()
+    encode_message = _ENC.encode
+    decode_message = _DEC.decode
+except ImportError:
+    # Fall back to stdlib json when msgspec is not installed
+    def encode_message(message):
+        return json.dumps(message).encode('utf-8')
+
+    def decode_message(raw):
+        return json.loads(raw.decode('utf-8'))
+
 def debug_native_host():
     """Simulate Proxxy native host for debugging"""
     print("=== Proxxy Native Host Debug Script ===")
@@ -22,26 +39,31 @@ def debug_native_host():
     print("Press Ctrl+C to exit")
     print("=" * 50)
     
+    # Bind hot-path callables once instead of resolving them per message
+    _write = sys.stdout.buffer.write
+    _flush = sys.stdout.buffer.flush
+    _read = sys.stdin.buffer.read
+    _now = time.time
+    
     def send_message(message):
         """Send message to Chrome Extension"""
-        encoded = json.dumps(message).encode('utf-8')
-        message_length = struct.pack('I', len(encoded))
-        sys.stdout.buffer.write(message_length + encoded)
-        sys.stdout.buffer.flush()
+        encoded = encode_message(message)
+        _write(_LEN.pack(len(encoded)))
+        _write(encoded)
+        _flush()
     
     def receive_message():
         """Receive message from Chrome Extension"""
         try:
             # Read 4-byte length header
-            raw_length = sys.stdin.buffer.read(4)
+            raw_length = _read(4)
             if len(raw_length) == 0:
                 return None
             
-            message_length = struct.unpack('I', raw_length)[0]
+            message_length = _LEN.unpack(raw_length)[0]
             
             # Read the message
-            message = sys.stdin.buffer.read(message_length).decode('utf-8')
-            return json.loads(message)
+            return decode_message(_read(message_length))
         except Exception as e:
             print(f"Error receiving message: {e}")
             return None
@@ -50,23 +72,23 @@ def debug_native_host():
         """Handle incoming message from extension"""
         print(f"Received: {message}")
         
-        response = {
-            "id": message.get("id", "unknown"),
-            "success": True,
-            "data": {
+        # Build only the payload that is actually sent
+        if message.get("module") == "system":
+            data = {"status": "debug_mode", "version": "debug-0.1.0"}
+        elif message.get("action") == "ping":
+            data = {"pong": True, "timestamp": _now()}
+        else:
+            data = {
                 "message": "Debug response",
-                "timestamp": time.time(),
+                "timestamp": _now(),
                 "received_message": message
             }
-        }
-        
-        # Special handling for ping
-        if message.get("action") == "ping":
-            response["data"] = {"pong": True, "timestamp": time.time()}
         
-        # Special handling for system messages
-        if message.get("module") == "system":
-            response["data"] = {"status": "debug_mode", "version": "debug-0.1.0"}
+        response = {
+            "id": message.get("id", "unknown"),
+            "success": True,
+            "data": data
+        }
         
         print(f"Sending: {response}")
         send_message(response)
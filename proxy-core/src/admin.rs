@@ -1,6 +1,13 @@
 use crate::Result;
-use axum::{routing::get, Json, Router};
+use axum::{
+    http::{header, HeaderMap, StatusCode},
+    response::{IntoResponse, Response},
+    routing::get,
+    Json, Router,
+};
 use serde::Serialize;
+use std::collections::hash_map::DefaultHasher;
+use std::hash::{Hash, Hasher};
 use std::net::SocketAddr;
 use std::sync::{
     atomic::{AtomicU64, Ordering},
@@ -61,7 +68,7 @@ pub async fn start_admin_server(port: u16, metrics: Arc<Metrics>, info: AgentInf
     let app = Router::new()
         .route("/health", get(health_handler))
         .route("/info", get(move || async { Json(info_cloned) }))
-        .route("/metrics", get(move || metrics_handler(metrics)));
+        .route("/metrics", get(move |headers: HeaderMap| metrics_handler(metrics, headers)));
 
     let addr = SocketAddr::from(([0, 0, 0, 0], port));
     info!("Starting Admin API on {}", addr);
@@ -83,7 +90,16 @@ async fn health_handler() -> Json<HealthResponse> {
     })
 }
 
-async fn metrics_handler(metrics: Arc<Metrics>) -> Json<MetricsResponse> {
+/// Cheap validator derived from the raw counters; identical counters yield the same ETag
+fn metrics_etag(counters: &[u64]) -> String {
+    let mut hasher = DefaultHasher::new();
+    counters.hash(&mut hasher);
+    format!("\"{:016x}\"", hasher.finish())
+}
+
+async fn metrics_handler(metrics: Arc<Metrics>, headers: HeaderMap) -> Response {
+    let total_requests = metrics.total_requests.load(Ordering::Relaxed);
+    let active_connections = metrics.active_connections.load(Ordering::Relaxed);
     let attempts = metrics.body_capture_attempts.load(Ordering::Relaxed);
     let successes = metrics.body_capture_successes.load(Ordering::Relaxed);
     let failures = metrics.body_capture_failures.load(Ordering::Relaxed);
@@ -91,6 +107,26 @@ async fn metrics_handler(metrics: Arc<Metrics>) -> Json<MetricsResponse> {
     let memory_errors = metrics.body_capture_memory_errors.load(Ordering::Relaxed);
     let total_latency_ms = metrics.body_capture_total_latency_ms.load(Ordering::Relaxed);
     let total_bytes = metrics.body_capture_total_bytes.load(Ordering::Relaxed);
+
+    let etag = metrics_etag(&[
+        total_requests,
+        active_connections,
+        attempts,
+        successes,
+        failures,
+        timeouts,
+        memory_errors,
+        total_latency_ms,
+        total_bytes,
+    ]);
+
+    // Unchanged counters: answer the conditional request without a body
+    let not_modified = headers
+        .get(header::IF_NONE_MATCH)
+        .map_or(false, |value| value.as_bytes() == etag.as_bytes());
+    if not_modified {
+        return (StatusCode::NOT_MODIFIED, [(header::ETAG, etag)]).into_response();
+    }
     
     let success_rate = if attempts > 0 {
         (successes as f64 / attempts as f64) * 100.0
@@ -104,9 +140,9 @@ async fn metrics_handler(metrics: Arc<Metrics>) -> Json<MetricsResponse> {
         0.0
     };
     
-    Json(MetricsResponse {
-        total_requests: metrics.total_requests.load(Ordering::Relaxed),
-        active_connections: metrics.active_connections.load(Ordering::Relaxed),
+    let body = Json(MetricsResponse {
+        total_requests,
+        active_connections,
         body_capture: BodyCaptureMetrics {
             attempts,
             successes,
@@ -117,5 +153,7 @@ async fn metrics_handler(metrics: Arc<Metrics>) -> Json<MetricsResponse> {
             average_latency_ms,
             total_bytes_captured: total_bytes,
         },
-    })
+    });
+
+    ([(header::ETAG, etag)], body).into_response()
 }
@@ -5,6 +5,7 @@ Proxy üzerinden testphp.vulnweb.com'a çeşitli HTTP metodları ile istek gönd
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import json
 
@@ -17,36 +18,47 @@ proxies = {
     'https': PROXY_URL
 }
 
+default_headers = {
+    "User-Agent": "Proxxy-Test-Client/1.0",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1"
+}
+
+# Keep-alive bağlantısı tüm istekler arasında paylaşılır
+SESSION = requests.Session()
+SESSION.headers.update(default_headers)
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 def send_request(method, path, data=None, headers=None):
     """HTTP isteği gönder"""
     url = f"{TARGET_BASE}{path}"
     
-    default_headers = {
-        "User-Agent": "Proxxy-Test-Client/1.0",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1"
-    }
-    
-    if headers:
-        default_headers.update(headers)
-    
     try:
         print(f"🚀 Gönderiliyor: {method} {url}")
         
-        response = requests.request(
-            method=method,
-            url=url,
-            proxies=proxies,
-            headers=default_headers,
+        response = SESSION.request(
+            method,
+            url,
             data=data,
+            headers=headers,
+            # İstek başına verilir: HTTP(S)_PROXY ortam değişkenleri Session.proxies'i ezer
+            proxies=proxies,
             timeout=15,
-            allow_redirects=True
+            allow_redirects=True,
+            stream=True
         )
         
-        print(f"✅ Yanıt: {response.status_code} - {len(response.content)} bytes")
+        # Gövde sıkıştırılmış haliyle (gzip açılmadan) sonuna kadar okunur: bağlantı
+        # pool'a geri döner ve proxy yanıtı yarıda kesilmez. Boyut her iki durumda da
+        # kablodaki byte sayısıdır (Content-Length ile aynı birim).
+        wire_bytes = sum(len(chunk) for chunk in response.raw.stream(65536, decode_content=False))
+        size = response.headers.get('Content-Length') or wire_bytes
+        response.close()
+        
+        print(f"✅ Yanıt: {response.status_code} - {size} bytes")
         return response
         
     except Exception as e:
@@ -89,7 +101,7 @@ def main():
     for i, (method, path, data, headers) in enumerate(test_requests, 1):
         print(f"\n[{i}/{len(test_requests)}] ", end="")
         send_request(method, path, data, headers)
-        time.sleep(1)  # İstekler arası kısa bekleme
+        time.sleep(0.05)  # İstekler arası kısa bekleme
     
     print(f"\n{'='*60}")
     print("✅ Tüm test istekleri gönderildi!")
@@ -9,12 +9,112 @@ Usage: python3 test_graphql_queries.py
 """
 
 import requests
+import io
 import json
 import sys
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import msgspec
+    _json_encode = msgspec.json.encode
+    _json_decode = msgspec.json.Decoder().decode
+    JSONDecodeError = msgspec.DecodeError
+except ImportError:
+    # Fall back to stdlib json when msgspec is not installed
+    def _json_encode(obj):
+        return json.dumps(obj).encode('utf-8')
+    _json_decode = json.loads
+    JSONDecodeError = json.JSONDecodeError
 
 GRAPHQL_URL = "http://127.0.0.1:9090/graphql"
 
+# Pooled sessions keep the connection to the orchestrator alive across queries.
+# Each thread gets its own so concurrent tests don't contend on one pool.
+_local = threading.local()
+_print_lock = threading.Lock()
+
+class _ThreadOutput:
+    """sys.stdout stand-in: threads that set _local.buffer write there instead,
+    so each concurrent test's output can be printed as one block when it ends"""
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        buffer = getattr(_local, "buffer", None)
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+def get_session():
+    """Return the calling thread's pooled session"""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = requests.Session()
+        session.headers['Content-Type'] = 'application/json'
+    return session
+
+# Read-only checks share one document with several root fields, so they cost
+# a single round-trip without the server having to accept batched requests
+READONLY_QUERY = """
+query ReadOnlyChecks {
+    hello
+    projects {
+        name
+        isActive
+        path
+    }
+    agents {
+        id
+        name
+        hostname
+        status
+        version
+        lastHeartbeat
+    }
+    requests(agentId: null) {
+        requestId
+        method
+        url
+        status
+        timestamp
+        agentId
+    }
+}
+"""
+
+# Tests answered from READONLY_QUERY: (test name, description, root fields it covers)
+READONLY_TESTS = [
+    ("Basic Connectivity", "Basic Connectivity Test", ("hello",)),
+    ("Project Listing", "Project Listing", ("projects",)),
+    ("Agents Listing", "Agents Listing", ("agents",)),
+    ("HTTP Transactions", "HTTP Transactions Listing", ("requests",)),
+    ("Complex Combined Query", "Complex Combined Query (Fixed)", ("hello", "projects", "agents", "requests")),
+]
+
+def report_result(query, variables, description, result):
+    """Print a GraphQL result and return whether it was error-free"""
+    print(f"\n{'='*60}")
+    print(f"TEST: {description}")
+    print(f"{'='*60}")
+    print(f"Query: {query.strip()[:100]}...")
+    if variables:
+        print(f"Variables: {json.dumps(variables, indent=2)}")
+    print(f"\nResponse:")
+    print(json.dumps(result, indent=2))
+    
+    # Check for errors
+    if "errors" in result:
+        print(f"❌ GraphQL Errors Found:")
+        for error in result["errors"]:
+            print(f"  - {error.get('message', 'Unknown error')}")
+        return False
+    else:
+        print(f"✅ Query executed successfully")
+        return True
+
 def execute_graphql(query, variables=None, description=""):
     """Execute a GraphQL query and return the result"""
     payload = {
@@ -23,65 +123,48 @@ def execute_graphql(query, variables=None, description=""):
     }
     
     try:
-        response = requests.post(
-            GRAPHQL_URL,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=10
-        )
+        response = get_session().post(GRAPHQL_URL, data=_json_encode(payload), timeout=10)
         response.raise_for_status()
-        result = response.json()
-        
-        print(f"\n{'='*60}")
-        print(f"TEST: {description}")
-        print(f"{'='*60}")
-        print(f"Query: {query.strip()[:100]}...")
-        if variables:
-            print(f"Variables: {json.dumps(variables, indent=2)}")
-        print(f"\nResponse:")
-        print(json.dumps(result, indent=2))
-        
-        # Check for errors
-        if "errors" in result:
-            print(f"❌ GraphQL Errors Found:")
-            for error in result["errors"]:
-                print(f"  - {error.get('message', 'Unknown error')}")
-            return False
-        else:
-            print(f"✅ Query executed successfully")
-            return True
+        result = _json_decode(response.content)
+        return report_result(query, variables, description, result)
             
     except requests.exceptions.RequestException as e:
         print(f"❌ HTTP Request failed: {e}")
         return False
-    except json.JSONDecodeError as e:
+    except JSONDecodeError as e:
         print(f"❌ JSON decode failed: {e}")
         return False
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return False
 
-def test_basic_connectivity():
-    """Test basic GraphQL connectivity"""
-    query = """
-    query HelloTest {
-        hello
-    }
-    """
-    return execute_graphql(query, description="Basic Connectivity Test")
+def execute_graphql_combined(query, tests):
+    """Run one multi-field query and report each (description, fields) test on its own slice"""
+    try:
+        response = get_session().post(GRAPHQL_URL, data=_json_encode({"query": query, "variables": {}}), timeout=10)
+        response.raise_for_status()
+        result = _json_decode(response.content)
+    except requests.exceptions.RequestException as e:
+        print(f"❌ HTTP Request failed: {e}")
+        return [False] * len(tests)
+    except JSONDecodeError as e:
+        print(f"❌ JSON decode failed: {e}")
+        return [False] * len(tests)
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return [False] * len(tests)
 
-def test_project_listing():
-    """Test project listing"""
-    query = """
-    query GetProjects {
-        projects {
-            name
-            isActive
-            path
-        }
-    }
-    """
-    return execute_graphql(query, description="Project Listing")
+    data = result.get("data") or {}
+    errors = result.get("errors") or []
+    outcomes = []
+    for description, fields in tests:
+        # A test sees only its own root fields and the errors located under them
+        sliced = {"data": {f: data.get(f) for f in fields}}
+        own_errors = [e for e in errors if not e.get("path") or e["path"][0] in fields]
+        if own_errors:
+            sliced["errors"] = own_errors
+        outcomes.append(report_result(query, None, description, sliced))
+    return outcomes
 
 def test_project_settings():
     """Test project settings query - This field doesn't exist in the schema"""
@@ -98,38 +181,6 @@ def test_project_settings():
     """
     return execute_graphql(query, description="Basic Project Info (projectSettings not available)")
 
-def test_agents_listing():
-    """Test agents listing"""
-    query = """
-    query GetAgents {
-        agents {
-            id
-            name
-            hostname
-            status
-            version
-            lastHeartbeat
-        }
-    }
-    """
-    return execute_graphql(query, description="Agents Listing")
-
-def test_http_transactions():
-    """Test HTTP transactions listing"""
-    query = """
-    query GetHttpTransactions {
-        requests(agentId: null) {
-            requestId
-            method
-            url
-            status
-            timestamp
-            agentId
-        }
-    }
-    """
-    return execute_graphql(query, description="HTTP Transactions Listing")
-
 def test_toggle_interception():
     """Test toggle interception mutation"""
     query = """
@@ -330,34 +381,6 @@ def test_response_body_capture_verification():
         print(f"❌ Response body verification failed: {e}")
         return False
 
-def test_complex_combined_query():
-    """Test a complex query that combines multiple fields"""
-    query = """
-    query CompleteStatus {
-        hello
-        projects {
-            name
-            isActive
-            path
-        }
-        agents {
-            id
-            name
-            status
-            lastHeartbeat
-        }
-        requests(agentId: null) {
-            requestId
-            method
-            url
-            status
-            timestamp
-        }
-    }
-    """
-    
-    return execute_graphql(query, description="Complex Combined Query (Fixed)")
-
 def test_create_and_delete_project():
     """Test project creation and deletion"""
     test_project_name = "graphql_test_project"
@@ -406,32 +429,54 @@ def main():
     print("Make sure the orchestrator is running with a project loaded!")
     print("=" * 60)
     
-    tests = [
-        ("Basic Connectivity", test_basic_connectivity),
-        ("Project Listing", test_project_listing),
+    # Read-only tests have no ordering dependencies and run concurrently;
+    # mutation tests stay serial because their side effects matter
+    readonly_tests = [
         ("Project Settings", test_project_settings),
-        ("Agents Listing", test_agents_listing),
-        ("HTTP Transactions", test_http_transactions),
-        ("Toggle Interception", test_toggle_interception),
         ("Update Scope", test_update_scope),
         ("Request Detail", test_request_detail),
         ("Response Body Capture Verification", test_response_body_capture_verification),
-        ("Complex Combined Query", test_complex_combined_query),
+    ]
+    stateful_tests = [
+        ("Toggle Interception", test_toggle_interception),
         ("Create/Delete Project", test_create_and_delete_project),
     ]
     
-    results = []
-    
-    for test_name, test_func in tests:
+    def run(test):
+        test_name, test_func = test
         print(f"\n🧪 Running: {test_name}")
         try:
-            success = test_func()
-            results.append((test_name, success))
+            return test_func()
         except Exception as e:
             print(f"❌ Test '{test_name}' failed with exception: {e}")
-            results.append((test_name, False))
-        
-        time.sleep(0.5)  # Small delay between tests
+            return False
+    
+    def run_buffered(test):
+        # Concurrent tests print into their own buffer, flushed whole on completion
+        _local.buffer = io.StringIO()
+        try:
+            return run(test)
+        finally:
+            output, _local.buffer = _local.buffer.getvalue(), None
+            with _print_lock:
+                sys.stdout.write(output)
+    
+    results = []
+    
+    # Read-only checks share a single multi-field query
+    print(f"\n🧪 Running combined query: {', '.join(name for name, _, _ in READONLY_TESTS)}")
+    combined = execute_graphql_combined(READONLY_QUERY, [(desc, fields) for _, desc, fields in READONLY_TESTS])
+    results.extend(zip((name for name, _, _ in READONLY_TESTS), combined))
+    
+    stdout, sys.stdout = sys.stdout, _ThreadOutput(sys.stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=6) as ex:
+            results.extend(zip((name for name, _ in readonly_tests), ex.map(run_buffered, readonly_tests)))
+    finally:
+        sys.stdout = stdout
+    
+    for test in stateful_tests:
+        results.append((test[0], run(test)))
     
     # Summary
     print(f"\n{'='*60}")
@@ -17,8 +17,21 @@ import shutil
 import random
 import urllib3
 import socket
+import re
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any
 
+try:
+    import msgspec
+    _json_encode = msgspec.json.encode
+    _json_decode = msgspec.json.Decoder().decode
+except ImportError:
+    # Fall back to stdlib json when msgspec is not installed
+    def _json_encode(obj):
+        return json.dumps(obj).encode('utf-8')
+    _json_decode = json.loads
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # --- CONFIGURATION ---
@@ -54,27 +67,35 @@ SCENARIOS = [
     ("GET", "/vuln/lfi?file=../../passwd", None),
 ]
 
+# Tek geçişte eşleştirme: host sonrası path, en uzun endpoint önce denenir ("/" en sona kalır)
+SCENARIO_PATTERN = re.compile(
+    r"^[a-z]+://[^/]+(" + "|".join(re.escape(ep) for ep in sorted({ep for _, ep, _ in SCENARIOS}, key=len, reverse=True)) + ")"
+)
+
 class IntegrationTest:
     def __init__(self):
         self.procs = []
         self.id_matrix = {}
+        self.session = requests.Session()
         
     def log(self, msg, level="INFO"):
         print(f"[{time.strftime('%H:%M:%S')}] {level}: {msg}")
 
     def graphql(self, query, variables=None):
         try:
-            res = requests.post(GRAPHQL_URL, json={"query": query, "variables": variables or {}}, timeout=10)
-            return res.json()
+            payload = _json_encode({"query": query, "variables": variables or {}})
+            res = self.session.post(GRAPHQL_URL, data=payload, headers={'Content-Type': 'application/json'}, timeout=10)
+            return _json_decode(res.content)
         except Exception as e:
             self.log(f"GraphQL Error: {e}", "ERROR")
             return None
 
     def check_port(self, port):
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        result = sock.connect_ex(('127.0.0.1', port))
-        sock.close()
-        return result == 0
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.1).close()
+            return True
+        except OSError:
+            return False
 
     # --- PHASE 0: STARTUP ---
     def start_services(self):
@@ -90,9 +111,9 @@ class IntegrationTest:
             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL 
         ))
         
-        for _ in range(15):
+        for _ in range(150):
             if self.check_port(9090) and self.check_port(50051): break
-            time.sleep(1)
+            time.sleep(0.1)
         else:
             self.log("❌ Orchestrator failed to bind ports", "ERROR"); return False
 
@@ -108,12 +129,12 @@ class IntegrationTest:
         self.log("   Starting Proxy Agent...")
         self.procs.append(subprocess.Popen(
             [PROXY_AGENT_BINARY, "--orchestrator-url", "http://127.0.0.1:50051", "--listen-port", "8080"],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         ))
 
-        for _ in range(10):
+        for _ in range(100):
             if self.check_port(8080): break
-            time.sleep(1)
+            time.sleep(0.1)
         else:
             self.log("❌ Proxy Agent failed to bind port 8080", "ERROR"); return False
 
@@ -124,30 +145,54 @@ class IntegrationTest:
         return True
 
     # --- PHASE 1: TRAFFIC ---
+    def _fire(self, session, method, endpoint, data):
+        url = f"{TEST_SERVER_URL}{endpoint}"
+        proxies = {'http': PROXY_URL, 'https': PROXY_URL}
+        try:
+            if method == "POST": session.post(url, json=data, proxies=proxies, timeout=5)
+            else: session.get(url, proxies=proxies, timeout=5)
+            return True
+        except:
+            self.log(f"   ⚠️ Failed to request {endpoint}", "WARN")
+            return False
+
     def generate_traffic(self):
         self.log(f"⚡ PHASE 1: Generating Traffic ({len(SCENARIOS)} requests)...")
-        proxies = {'http': PROXY_URL, 'https': PROXY_URL}
         
-        success = 0
-        for method, endpoint, data in SCENARIOS:
-            url = f"{TEST_SERVER_URL}{endpoint}"
-            try:
-                if method == "POST": requests.post(url, json=data, proxies=proxies, timeout=5)
-                else: requests.get(url, proxies=proxies, timeout=5)
-                success += 1
-                time.sleep(0.05) # Throttle slightly
-            except:
-                self.log(f"   ⚠️ Failed to request {endpoint}", "WARN")
+        # Tek session + pool: istekler proxy üzerinden paralel gönderilir
+        session = requests.Session()
+        session.mount('http://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            success = sum(ex.map(lambda s: self._fire(session, *s), SCENARIOS))
+        session.close()
         
-        self.log(f"   Sent {success} requests. Waiting 5s for DB Sync...")
-        time.sleep(5)
+        self.log(f"   Sent {success} requests. Waiting for DB Sync...")
+        self.wait_for_db_sync(success)
+
+    def wait_for_db_sync(self, expected, attempts=50, interval=0.1):
+        # Yanıtı yazılmış kayıt sayısı beklenen değere ulaşıp iki ölçümde sabit kalınca çık (üst sınır ~5s).
+        # Satır istekle eklenir, status/body Response event'iyle sonradan UPDATE edilir.
+        last = -1
+        for _ in range(attempts):
+            res = self.graphql(
+                "query($u: String!) { requests(agentId: null, urlContains: $u) { requestId status } }",
+                {"u": TEST_SERVER_URL})
+            n = sum(r["status"] is not None for r in res["data"]["requests"]) if res and res.get("data") else -1
+            if n == last and n >= expected: break
+            last = n
+            time.sleep(interval)
+        else:
+            self.log(f"   ⚠️ DB Sync not settled ({last} records)", "WARN")
 
     # --- PHASE 2: VERIFICATION ---
     def verify_capture(self):
         self.log("🔍 PHASE 2: Verifying Data Integrity...")
         
-        # 1. Get List (Lightweight)
-        res = self.graphql("query { requests(agentId: null) { requestId url } }")
+        # 1. Get List (Lightweight) - sadece test sunucusuna giden kayıtlar; filtre sunucuda
+        # uygulanır, başka trafik bu çalıştırmanın kayıtlarını 50'lik pencereden itemez
+        res = self.graphql(
+            "query($u: String!) { requests(agentId: null, urlContains: $u) { requestId url } }",
+            {"u": TEST_SERVER_URL})
         if not res or "data" not in res:
             self.log("❌ Failed to fetch list from DB", "ERROR"); return False
 
@@ -157,26 +202,28 @@ class IntegrationTest:
         # Build Matrix
         self.id_matrix = {}
         for r in requests_list:
-            for _, ep, _ in SCENARIOS:
-                if ep in r["url"]: self.id_matrix[ep] = r["requestId"]
+            m = SCENARIO_PATTERN.search(r["url"])
+            if m: self.id_matrix[m.group(1)] = r["requestId"]
 
         # 2. Deep Check (Heavyweight)
         all_good = True
         criticals = ["/api/json", "/api/echo", "/api/large"]
         
+        present = []
         for ep in criticals:
             if ep not in self.id_matrix:
-                self.log(f"   ❌ Missing capture for {ep}", "ERROR"); all_good = False; continue
-
-            # Get Full Detail
-            detail = self.graphql("""
-                query GetDetail($id: String!) {
-                    request(id: $id) { responseBody status }
-                }
-            """, {"id": self.id_matrix[ep]})
-            
-            data = detail.get("data", {}).get("request", {})
-            body = data.get("responseBody", "")
+                self.log(f"   ❌ Missing capture for {ep}", "ERROR"); all_good = False
+            else: present.append(ep)
+        if not present: return all_good
+
+        # Get Full Detail - tek sorguda alias'larla (r0, r1, ...) tüm kritikler
+        parts = [f'r{i}: request(id: "{self.id_matrix[ep]}") {{ responseBody status }}' for i, ep in enumerate(present)]
+        detail = self.graphql("query { " + " ".join(parts) + " }") or {}
+        details = detail.get("data") or {}
+
+        for i, ep in enumerate(present):
+            data = details.get(f"r{i}") or {}
+            body = data.get("responseBody") or ""
             
             # Content Checks
             if ep == "/api/json":
@@ -195,6 +242,7 @@ class IntegrationTest:
 
     def cleanup(self):
         self.log("🧹 Cleaning up...")
+        self.session.close()
         for p in self.procs:
             p.terminate()
             try: p.wait(timeout=1)
@@ -212,11 +260,9 @@ class IntegrationTest:
             # --- YENİ EKLENEN KISIM: ID LISTESI ---
             print("\n📋 CAPTURED REQUEST IDs (Copy & Paste):")
             print("-" * 50)
-            # URL uzunsa hizalamak için ljust kullanıyoruz
+            # URL uzunsa hizalamak için ljust kullanıyoruz (matris anahtarları zaten path)
             for endpoint, req_id in self.id_matrix.items():
-                # Sadece path kısmını göster (http://localhost... kısmını at)
-                short_ep = endpoint.split("8000")[-1] if "8000" in endpoint else endpoint
-                print(f"{short_ep.ljust(25)} : {req_id}")
+                print(f"{endpoint.ljust(25)} : {req_id}")
             print("-" * 50)
             # -------------------------------------
 
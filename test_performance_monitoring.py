@@ -7,19 +7,63 @@ are properly recorded and exposed via the admin API.
 
 import asyncio
 import json
+import logging
 import time
 import requests
 import subprocess
 import signal
 import os
 import sys
+import socket
+import select
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+except ImportError:
+    # Without aiohttp the traffic is sent concurrently from worker threads instead
+    aiohttp = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # Fall back to stdlib json when orjson is not installed
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Fields reported under "body_capture" by the proxy agent's admin /metrics endpoint
+BODY_CAPTURE_FIELDS = (
+    "attempts", "successes", "failures", "timeouts", "memory_errors",
+    "success_rate", "average_latency_ms", "total_bytes_captured",
+)
+
+# Monotonic counters among BODY_CAPTURE_FIELDS (rates and averages excluded)
+COUNTER_FIELDS = ("attempts", "successes", "failures", "timeouts", "memory_errors", "total_bytes_captured")
+
+# Counters that must grow during the test, with the error reported when they don't
+REQUIRED_INCREASES = (
+    ("attempts", "Body capture attempts did not increase"),
+    ("successes", "Body capture successes did not increase"),
+    ("total_bytes_captured", "No bytes were captured"),
+)
+
+# Error counters that are reported (but not fatal) when they grow during the test
+WARN_ON_INCREASE = ("failures", "timeouts", "memory_errors")
 
 class PerformanceMonitoringTest:
     def __init__(self):
-        self.orchestrator_process: Optional[subprocess.Popen] = None
-        self.proxy_agent_process: Optional[subprocess.Popen] = None
-        self.test_server_process: Optional[subprocess.Popen] = None
+        # Running services keyed by name, in launch order
+        self.processes: Dict[str, subprocess.Popen] = {}
+        # Exit codes of services that have died, filled in by the SIGCHLD handler
+        self._exited: Dict[str, int] = {}
+        # Launch times (monotonic) and whether test traffic has been sent yet
+        self._started_at: Dict[str, float] = {}
+        self._traffic_generated = False
         
         # Configuration
         self.orchestrator_port = 8080
@@ -29,40 +73,98 @@ class PerformanceMonitoringTest:
         self.test_server_port = 3000
         self.project_name = "performance_test"
         
-    def start_orchestrator(self) -> bool:
-        """Start the orchestrator with project support"""
-        print("🚀 Starting orchestrator...")
-        try:
-            self.orchestrator_process = subprocess.Popen([
+        self.proxy_url = f"http://localhost:{self.proxy_port}"
+        self.admin_url = f"http://localhost:{self.admin_port}"
+        
+        # One pooled client for every admin API call
+        # Local calls only: ignore HTTP(S)_PROXY from the environment
+        self.http = requests.Session()
+        self.http.trust_env = False
+        self.http.mount("http://", HTTPAdapter(pool_maxsize=16))
+        
+        # Test traffic: JSON, XML, large and HTML responses, 3 requests per endpoint
+        self._urls = tuple(
+            url
+            for url in (f"http://localhost:{self.test_server_port}{path}" for path in ("/api/json", "/api/xml", "/api/large", "/"))
+            for _ in range(3)
+        )
+        
+        # Child output goes to temp files (read only on failure) so an undrained pipe can't block a child
+        self._logs: Dict[str, Any] = {}
+        
+        # Last admin metrics snapshot and its ETag, for conditional requests
+        self._metrics_cache: Optional[Dict[str, Any]] = None
+        self._metrics_etag: Optional[str] = None
+        
+    def _reap(self, signum=None, frame=None):
+        """SIGCHLD handler: record exit codes of finished services without polling each one"""
+        for name, process in self.processes.items():
+            if name in self._exited:
+                continue
+            try:
+                pid, status = os.waitpid(process.pid, os.WNOHANG)
+            except ChildProcessError:
+                # Already reaped through the Popen object
+                if process.returncode is not None:
+                    self._exited[name] = process.returncode
+                continue
+            if pid:
+                process.returncode = os.waitstatus_to_exitcode(status)
+                self._exited[name] = process.returncode
+    
+    def _wait_for_port(self, port: int, name: str, timeout: float = 10.0) -> bool:
+        """Poll until the port accepts connections, the service exits, or timeout expires"""
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            if name in self._exited:
+                return False
+            try:
+                socket.create_connection(("localhost", port), timeout=0.2).close()
+                return True
+            except OSError:
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+        return False
+    
+    def _wait_for_metrics(self, name: str, timeout: float = 10.0) -> bool:
+        """Poll the admin /metrics endpoint until it answers HTTP 200"""
+        if not self._wait_for_port(self.admin_port, name, timeout):
+            return False
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and name not in self._exited:
+            try:
+                if self.http.get(f"{self.admin_url}/metrics", timeout=0.5).status_code == 200:
+                    return True
+            except requests.exceptions.RequestException:
+                pass
+            time.sleep(0.05)
+        return False
+    
+    def _log_files(self, name: str):
+        """Create the stdout/stderr temp files for a child process"""
+        self._logs[name] = (tempfile.TemporaryFile(), tempfile.TemporaryFile())
+        return self._logs[name]
+    
+    def _read_logs(self, name: str, limit: int = 4096):
+        """Read the tail of a child's stdout/stderr temp files without waiting on the child"""
+        output = []
+        for log_file in self._logs[name]:
+            size = os.fstat(log_file.fileno()).st_size
+            log_file.seek(max(0, size - limit))
+            output.append(log_file.read(limit).decode("utf-8", "replace"))
+        return output
+    
+    def _service_specs(self):
+        """(name, argv, ready port, extra readiness probe) for each service, in launch order"""
+        return [
+            ("Orchestrator", [
                 "./target/release/orchestrator",
                 "--project", self.project_name,
                 "--http-port", str(self.orchestrator_port),
                 "--grpc-port", str(self.grpc_port)
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            
-            # Wait for orchestrator to start
-            time.sleep(3)
-            
-            # Check if process is still running
-            if self.orchestrator_process.poll() is not None:
-                stdout, stderr = self.orchestrator_process.communicate()
-                print(f"❌ Orchestrator failed to start:")
-                print(f"STDOUT: {stdout}")
-                print(f"STDERR: {stderr}")
-                return False
-                
-            print("✅ Orchestrator started successfully")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Failed to start orchestrator: {e}")
-            return False
-    
-    def start_proxy_agent(self) -> bool:
-        """Start the proxy agent with body capture enabled"""
-        print("🚀 Starting proxy agent with body capture...")
-        try:
-            self.proxy_agent_process = subprocess.Popen([
+            ], self.orchestrator_port, None),
+            ("Proxy agent", [
                 "./target/release/proxy-agent",
                 "--orchestrator-url", f"http://localhost:{self.grpc_port}",
                 "--listen-port", str(self.proxy_port),
@@ -71,136 +173,169 @@ class PerformanceMonitoringTest:
                 "--max-body-size", "1048576",  # 1MB
                 "--response-timeout", "30",    # 30 seconds
                 "--stream-timeout", "5"        # 5 seconds
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            
-            # Wait for proxy agent to start
-            time.sleep(3)
-            
-            # Check if process is still running
-            if self.proxy_agent_process.poll() is not None:
-                stdout, stderr = self.proxy_agent_process.communicate()
-                print(f"❌ Proxy agent failed to start:")
-                print(f"STDOUT: {stdout}")
-                print(f"STDERR: {stderr}")
-                return False
-                
-            print("✅ Proxy agent started successfully")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Failed to start proxy agent: {e}")
-            return False
-    
-    def start_test_server(self) -> bool:
-        """Start the test server"""
-        print("🚀 Starting test server...")
-        try:
-            self.test_server_process = subprocess.Popen([
+            ], self.proxy_port, self._wait_for_metrics),
+            ("Test server", [
                 "./target/release/test_server",
                 "--port", str(self.test_server_port)
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            
-            # Wait for test server to start
-            time.sleep(2)
-            
-            # Check if process is still running
-            if self.test_server_process.poll() is not None:
-                stdout, stderr = self.test_server_process.communicate()
-                print(f"❌ Test server failed to start:")
-                print(f"STDOUT: {stdout}")
-                print(f"STDERR: {stderr}")
-                return False
-                
-            print("✅ Test server started successfully")
-            return True
-            
+            ], self.test_server_port, None),
+        ]
+    
+    def _launch(self, name: str, argv) -> Optional[subprocess.Popen]:
+        """Launch a service without waiting for readiness"""
+        logger.info("🚀 Starting %s...", name)
+        try:
+            stdout, stderr = self._log_files(name)
+            return subprocess.Popen(argv, stdout=stdout, stderr=stderr)
         except Exception as e:
-            print(f"❌ Failed to start test server: {e}")
+            logger.error("❌ Failed to start %s: %s", name, e)
+            return None
+    
+    def _wait_ready(self, name: str, ready_port: int, probe) -> bool:
+        """Wait for a launched service's port (and optional extra probe), then report the outcome"""
+        ready = self._wait_for_port(ready_port, name) and (probe is None or probe(name))
+        
+        if name in self._exited:
+            stdout, stderr = self._read_logs(name)
+            logger.error("❌ %s failed to start:", name)
+            logger.error("STDOUT: %s", stdout)
+            logger.error("STDERR: %s", stderr)
             return False
+        
+        if not ready:
+            logger.error("❌ %s did not become ready in time", name)
+            return False
+        
+        logger.info("✅ %s started successfully", name)
+        return True
     
     def get_admin_metrics(self) -> Optional[Dict[str, Any]]:
-        """Get metrics from the admin API"""
+        """Get metrics from the admin API (conditional GET: a 304 reuses the cached snapshot)"""
+        headers = {"If-None-Match": self._metrics_etag} if self._metrics_etag else {}
         try:
-            response = requests.get(f"http://localhost:{self.admin_port}/metrics", timeout=5)
+            response = self.http.get(f"{self.admin_url}/metrics", headers=headers, timeout=5)
+            if response.status_code == 304:
+                return self._metrics_cache
             if response.status_code == 200:
-                return response.json()
+                self._metrics_cache = _json_loads(response.content)
+                self._metrics_etag = response.headers.get("ETag")
+                return self._metrics_cache
             else:
-                print(f"❌ Failed to get metrics: HTTP {response.status_code}")
+                logger.error("❌ Failed to get metrics: HTTP %s", response.status_code)
                 return None
         except Exception as e:
-            print(f"❌ Failed to get admin metrics: {e}")
+            logger.error("❌ Failed to get admin metrics: %s", e)
             return None
     
-    def generate_test_traffic(self) -> bool:
+    async def _fire(self, session: "aiohttp.ClientSession", url: str):
+        """Send one GET through the proxy and return (status, body size)"""
+        async with session.get(url, proxy=self.proxy_url) as response:
+            return response.status, len(await response.read())
+    
+    def _fire_sync(self, url: str):
+        """Thread-based fallback for _fire when aiohttp is not installed"""
+        proxies = {"http": self.proxy_url, "https": self.proxy_url}
+        with self.http.get(url, proxies=proxies, timeout=10) as response:
+            return response.status_code, len(response.content)
+    
+    async def generate_test_traffic(self) -> bool:
         """Generate test traffic through the proxy to exercise body capture"""
-        print("📡 Generating test traffic...")
-        
-        proxy_url = f"http://localhost:{self.proxy_port}"
-        test_endpoints = [
-            f"http://localhost:{self.test_server_port}/api/json",      # JSON response
-            f"http://localhost:{self.test_server_port}/api/xml",       # XML response  
-            f"http://localhost:{self.test_server_port}/api/large",     # Large response
-            f"http://localhost:{self.test_server_port}/",              # HTML response
-        ]
+        logger.info("📡 Generating test traffic...")
         
-        success_count = 0
-        total_requests = len(test_endpoints) * 3  # 3 requests per endpoint
+        urls = self._urls
+        total_requests = len(urls)
         
-        for endpoint in test_endpoints:
-            for i in range(3):  # Make 3 requests to each endpoint
-                try:
-                    print(f"  📤 Request {success_count + 1}/{total_requests}: {endpoint}")
-                    
-                    # Make request through proxy
-                    response = requests.get(
-                        endpoint,
-                        proxies={"http": proxy_url, "https": proxy_url},
-                        timeout=10
-                    )
-                    
-                    if response.status_code == 200:
-                        success_count += 1
-                        print(f"    ✅ Success: {len(response.content)} bytes")
-                    else:
-                        print(f"    ❌ Failed: HTTP {response.status_code}")
-                        
-                    # Small delay between requests
-                    time.sleep(0.5)
-                    
-                except Exception as e:
-                    print(f"    ❌ Request failed: {e}")
+        # Fire all requests concurrently to exercise the proxy's concurrent body capture path
+        if aiohttp is not None:
+            connector = aiohttp.TCPConnector(limit=16)
+            timeout = aiohttp.ClientTimeout(total=10)
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                results = await asyncio.gather(*(self._fire(session, url) for url in urls), return_exceptions=True)
+        else:
+            results = await asyncio.gather(*(asyncio.to_thread(self._fire_sync, url) for url in urls),
+                                           return_exceptions=True)
         
-        print(f"📊 Traffic generation complete: {success_count}/{total_requests} successful")
+        success_count = 0
+        for i, (url, result) in enumerate(zip(urls, results), 1):
+            logger.info("  📤 Request %s/%s: %s", i, total_requests, url)
+            if isinstance(result, Exception):
+                logger.error("    ❌ Request failed: %s", result)
+                continue
+            status, size = result
+            if status == 200:
+                success_count += 1
+                logger.info("    ✅ Success: %s bytes", size)
+            else:
+                logger.error("    ❌ Failed: HTTP %s", status)
+        
+        logger.info("📊 Traffic generation complete: %s/%s successful", success_count, total_requests)
         return success_count > 0
     
+    async def _poll_metrics_until_settled(self, traffic_done: asyncio.Event,
+                                          interval: float = 0.2, timeout: float = 10.0):
+        """Poll admin metrics until traffic is done and attempts stay unchanged for 2 consecutive reads"""
+        last_attempts = None
+        stable_reads = 0
+        deadline = None
+        while True:
+            metrics = await asyncio.to_thread(self.get_admin_metrics)
+            attempts = metrics.get("body_capture", {}).get("attempts") if metrics else None
+            if traffic_done.is_set():
+                if deadline is None:
+                    deadline = time.monotonic() + timeout
+                stable_reads = stable_reads + 1 if attempts is not None and attempts == last_attempts else 0
+                if stable_reads >= 2 or time.monotonic() >= deadline:
+                    return metrics
+            last_attempts = attempts
+            await asyncio.sleep(interval)
+    
+    async def _run_traffic_and_poll(self):
+        """Generate traffic while polling metrics in the background; returns (traffic ok, settled metrics)"""
+        traffic_done = asyncio.Event()
+        poller = asyncio.create_task(self._poll_metrics_until_settled(traffic_done))
+        try:
+            traffic_ok = await self.generate_test_traffic()
+        finally:
+            traffic_done.set()
+        
+        if not traffic_ok:
+            poller.cancel()
+            return False, None
+        return True, await poller
+    
+    def _is_fresh_agent(self, max_age: float = 10.0) -> bool:
+        """True if the proxy agent was launched moments ago and has not been sent any traffic"""
+        started_at = self._started_at.get("Proxy agent")
+        return (started_at is not None and not self._traffic_generated
+                and time.monotonic() - started_at < max_age)
+    
     def verify_performance_metrics(self) -> bool:
         """Verify that performance metrics are properly recorded"""
-        print("📊 Verifying performance metrics...")
+        logger.info("📊 Verifying performance metrics...")
         
-        # Get initial metrics
-        initial_metrics = self.get_admin_metrics()
+        # Get initial metrics; a freshly started agent that has seen no traffic is all zeros
+        if self._is_fresh_agent():
+            initial_metrics = {"body_capture": dict.fromkeys(BODY_CAPTURE_FIELDS, 0)}
+        else:
+            initial_metrics = self.get_admin_metrics()
         if not initial_metrics:
-            print("❌ Failed to get initial metrics")
+            logger.error("❌ Failed to get initial metrics")
             return False
         
-        print("📈 Initial metrics:")
+        logger.info("📈 Initial metrics:")
         self.print_body_capture_metrics(initial_metrics)
         
-        # Generate traffic
-        if not self.generate_test_traffic():
-            print("❌ Failed to generate test traffic")
+        # Generate traffic; final metrics are polled concurrently until the counters settle
+        self._traffic_generated = True
+        traffic_ok, final_metrics = asyncio.run(self._run_traffic_and_poll())
+        if not traffic_ok:
+            logger.error("❌ Failed to generate test traffic")
             return False
         
-        # Wait a moment for metrics to be updated
-        time.sleep(2)
-        
-        # Get final metrics
-        final_metrics = self.get_admin_metrics()
         if not final_metrics:
-            print("❌ Failed to get final metrics")
+            logger.error("❌ Failed to get final metrics")
             return False
         
-        print("📈 Final metrics:")
+        logger.info("📈 Final metrics:")
         self.print_body_capture_metrics(final_metrics)
         
         # Verify metrics have changed
@@ -210,143 +345,187 @@ class PerformanceMonitoringTest:
         """Print body capture metrics in a readable format"""
         if "body_capture" in metrics:
             bc = metrics["body_capture"]
-            print(f"  📊 Body Capture Metrics:")
-            print(f"    • Attempts: {bc.get('attempts', 0)}")
-            print(f"    • Successes: {bc.get('successes', 0)}")
-            print(f"    • Failures: {bc.get('failures', 0)}")
-            print(f"    • Timeouts: {bc.get('timeouts', 0)}")
-            print(f"    • Memory Errors: {bc.get('memory_errors', 0)}")
-            print(f"    • Success Rate: {bc.get('success_rate', 0):.1f}%")
-            print(f"    • Average Latency: {bc.get('average_latency_ms', 0):.2f}ms")
-            print(f"    • Total Bytes Captured: {bc.get('total_bytes_captured', 0)}")
+            logger.info("  📊 Body Capture Metrics:")
+            logger.info("    • Attempts: %s", bc.get('attempts', 0))
+            logger.info("    • Successes: %s", bc.get('successes', 0))
+            logger.info("    • Failures: %s", bc.get('failures', 0))
+            logger.info("    • Timeouts: %s", bc.get('timeouts', 0))
+            logger.info("    • Memory Errors: %s", bc.get('memory_errors', 0))
+            logger.info("    • Success Rate: %.1f%%", bc.get('success_rate', 0))
+            logger.info("    • Average Latency: %.2fms", bc.get('average_latency_ms', 0))
+            logger.info("    • Total Bytes Captured: %s", bc.get('total_bytes_captured', 0))
         else:
-            print("  ❌ No body_capture metrics found")
+            logger.error("  ❌ No body_capture metrics found")
     
     def validate_metrics_changes(self, initial: Dict[str, Any], final: Dict[str, Any]) -> bool:
         """Validate that metrics have changed as expected"""
-        print("🔍 Validating metrics changes...")
+        logger.info("🔍 Validating metrics changes...")
         
         if "body_capture" not in initial or "body_capture" not in final:
-            print("❌ Body capture metrics not found in initial or final metrics")
+            logger.error("❌ Body capture metrics not found in initial or final metrics")
             return False
         
         initial_bc = initial["body_capture"]
         final_bc = final["body_capture"]
         
-        # Check that attempts increased
-        attempts_diff = final_bc.get("attempts", 0) - initial_bc.get("attempts", 0)
-        if attempts_diff <= 0:
-            print(f"❌ Body capture attempts did not increase: {attempts_diff}")
-            return False
-        
-        # Check that successes increased
-        successes_diff = final_bc.get("successes", 0) - initial_bc.get("successes", 0)
-        if successes_diff <= 0:
-            print(f"❌ Body capture successes did not increase: {successes_diff}")
-            return False
-        
-        # Check that bytes were captured
-        bytes_diff = final_bc.get("total_bytes_captured", 0) - initial_bc.get("total_bytes_captured", 0)
-        if bytes_diff <= 0:
-            print(f"❌ No bytes were captured: {bytes_diff}")
-            return False
+        # Compute every counter delta in one pass, then check the ones that must have grown
+        deltas = {key: final_bc.get(key, 0) - initial_bc.get(key, 0) for key in COUNTER_FIELDS}
+        for key, message in REQUIRED_INCREASES:
+            if deltas[key] <= 0:
+                logger.error("❌ %s: %s", message, deltas[key])
+                return False
+        for key in WARN_ON_INCREASE:
+            if deltas[key] > 0:
+                logger.warning("⚠️  Body capture %s increased during the run: +%s", key, deltas[key])
         
         # Check success rate is reasonable
         success_rate = final_bc.get("success_rate", 0)
         if success_rate < 50:  # At least 50% success rate
-            print(f"❌ Success rate too low: {success_rate}%")
+            logger.error("❌ Success rate too low: %s%%", success_rate)
             return False
         
         # Check average latency is recorded
         avg_latency = final_bc.get("average_latency_ms", 0)
         if avg_latency <= 0:
-            print(f"❌ Average latency not recorded: {avg_latency}ms")
+            logger.error("❌ Average latency not recorded: %sms", avg_latency)
             return False
         
-        print("✅ All metrics validations passed:")
-        print(f"  • Attempts increased by: {attempts_diff}")
-        print(f"  • Successes increased by: {successes_diff}")
-        print(f"  • Bytes captured: {bytes_diff}")
-        print(f"  • Success rate: {success_rate:.1f}%")
-        print(f"  • Average latency: {avg_latency:.2f}ms")
+        logger.info("✅ All metrics validations passed:")
+        logger.info("  • Attempts increased by: %s", deltas["attempts"])
+        logger.info("  • Successes increased by: %s", deltas["successes"])
+        logger.info("  • Bytes captured: %s", deltas["total_bytes_captured"])
+        logger.info("  • Success rate: %.1f%%", success_rate)
+        logger.info("  • Average latency: %.2fms", avg_latency)
         
         return True
     
+    def _wait_all(self, processes, timeout: float):
+        """Wait for all processes to exit against one shared deadline"""
+        deadline = time.monotonic() + timeout
+        if not hasattr(os, "pidfd_open"):
+            # No pidfd support (non-Linux): wait on each in turn
+            for process in processes:
+                try:
+                    process.wait(timeout=max(0, deadline - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    pass
+            return
+        
+        # A pidfd becomes readable when its process exits, so one poll() covers all children
+        poller = select.poll()
+        pending = {}
+        for process in processes:
+            try:
+                fd = os.pidfd_open(process.pid)
+            except ProcessLookupError:
+                continue
+            pending[fd] = process
+            poller.register(fd, select.POLLIN)
+        
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for fd, _ in poller.poll(remaining * 1000):
+                    poller.unregister(fd)
+                    os.close(fd)
+                    pending.pop(fd).poll()  # reap
+        finally:
+            for fd in pending:
+                os.close(fd)
+    
     def cleanup(self):
         """Clean up all processes"""
-        print("🧹 Cleaning up processes...")
-        
-        processes = [
-            ("Test Server", self.test_server_process),
-            ("Proxy Agent", self.proxy_agent_process),
-            ("Orchestrator", self.orchestrator_process),
-        ]
+        logger.info("🧹 Cleaning up processes...")
         
-        for name, process in processes:
-            if process and process.poll() is None:
-                print(f"  🛑 Stopping {name}...")
+        # Signal every live process first (reverse launch order) so they shut down in parallel
+        live = []
+        for name, process in reversed(list(self.processes.items())):
+            if name not in self._exited:
+                logger.info("  🛑 Stopping %s...", name)
                 try:
                     process.terminate()
-                    process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    print(f"    ⚠️  Force killing {name}...")
-                    process.kill()
-                    process.wait()
+                    live.append((name, process))
                 except Exception as e:
-                    print(f"    ❌ Error stopping {name}: {e}")
+                    logger.error("    ❌ Error stopping %s: %s", name, e)
+        
+        self._wait_all([process for _, process in live], timeout=5)
+        self._reap()
+        
+        for name, process in live:
+            if name not in self._exited:
+                logger.warning("    ⚠️  Force killing %s...", name)
+                process.kill()
+                process.wait()
+        
+        for log_file in (f for files in self._logs.values() for f in files):
+            log_file.close()
+        self.http.close()
     
     def run_test(self) -> bool:
         """Run the complete performance monitoring test"""
-        print("🧪 Starting Performance Monitoring Test")
-        print("=" * 50)
+        logger.info("🧪 Starting Performance Monitoring Test")
+        logger.info("%s", "=" * 50)
         
+        previous_sigchld = signal.signal(signal.SIGCHLD, self._reap)
         try:
-            # Start all services
-            if not self.start_orchestrator():
-                return False
-            
-            if not self.start_proxy_agent():
-                return False
-            
-            if not self.start_test_server():
-                return False
+            # Launch all services back-to-back, then wait for them in parallel
+            specs = self._service_specs()
+            for name, argv, _, _ in specs:
+                process = self._launch(name, argv)
+                if process is None:
+                    return False
+                self.processes[name] = process
+                self._started_at[name] = time.monotonic()
+                self._reap()  # catch a child that exited before it was registered
             
-            # Wait for all services to be ready
-            print("⏳ Waiting for services to be ready...")
-            time.sleep(5)
+            with ThreadPoolExecutor(max_workers=len(specs)) as executor:
+                waits = [executor.submit(self._wait_ready, name, port, probe) for name, _, port, probe in specs]
+                if not all([wait.result() for wait in waits]):
+                    return False
             
             # Run the performance monitoring test
             success = self.verify_performance_metrics()
             
             if success:
-                print("\n🎉 Performance Monitoring Test PASSED!")
-                print("✅ All body capture metrics are working correctly")
+                logger.info("\n🎉 Performance Monitoring Test PASSED!")
+                logger.info("✅ All body capture metrics are working correctly")
             else:
-                print("\n❌ Performance Monitoring Test FAILED!")
+                logger.error("\n❌ Performance Monitoring Test FAILED!")
                 
             return success
             
         except KeyboardInterrupt:
-            print("\n⚠️  Test interrupted by user")
+            logger.warning("\n⚠️  Test interrupted by user")
             return False
         except Exception as e:
-            print(f"\n❌ Test failed with exception: {e}")
+            logger.error("\n❌ Test failed with exception: %s", e)
             return False
         finally:
             self.cleanup()
+            signal.signal(signal.SIGCHLD, previous_sigchld)
 
 def main():
     """Main function"""
-    if not os.path.exists("./target/release/orchestrator"):
-        print("❌ Orchestrator binary not found. Please run 'cargo build --release' first.")
-        return 1
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO").upper(), format="%(message)s", stream=sys.stdout)
     
-    if not os.path.exists("./target/release/proxy-agent"):
-        print("❌ Proxy agent binary not found. Please run 'cargo build --release' first.")
-        return 1
+    # Use the libuv event loop for the asyncio traffic path when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    try:
+        with os.scandir("./target/release") as entries:
+            present = {entry.name for entry in entries}
+    except FileNotFoundError:
+        present = set()
     
-    if not os.path.exists("./target/release/test_server"):
-        print("❌ Test server binary not found. Please run 'cargo build --release' first.")
+    missing = {"orchestrator", "proxy-agent", "test_server"} - present
+    if missing:
+        logger.error("❌ Binaries not found: %s. Please run 'cargo build --release' first.", ', '.join(sorted(missing)))
         return 1
     
     test = PerformanceMonitoringTest()
@@ -9,18 +9,35 @@ Bu script response body capture özelliğinin çalışıp çalışmadığını t
 4. Response body'lerin yakalanıp yakalanmadığını kontrol eder
 5. GraphQL API üzerinden response body'leri sorgular
 
-Kullanım: python3 test_response_body_capture.py
+Kullanım: python3 test_response_body_capture.py [--verbose]
+  --verbose  Servis çıktılarını /tmp/proxxy_*.log yerine bellekte topla
 """
 
 import subprocess
 import time
 import requests
 import json
+import re
 import sys
 import os
 import signal
 import shutil
-from typing import Optional, Dict, Any
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, Callable, List
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson kurulu değilse stdlib json kullanılır
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+    _json_loads = json.loads
 
 # Konfigürasyon
 ORCHESTRATOR_BINARY = "./target/debug/orchestrator"
@@ -28,6 +45,12 @@ PROXY_AGENT_BINARY = "./target/debug/proxy-agent"
 GRAPHQL_URL = "http://127.0.0.1:9090/graphql"
 PROXY_URL = "http://127.0.0.1:9095"  # Proxy agent default port
 TEST_PROJECT_NAME = "response_body_test"
+# Proxy'ler istek başına verilir: requests, HTTP(S)_PROXY ortam değişkenlerini
+# Session.proxies'in önüne koyar ama istek başına verilen proxies= değerinin önüne koymaz.
+# Yerel servislere giden istekler hiçbir proxy kullanmasın
+NO_PROXY = {"http": None, "https": None}
+# Test trafiği her koşulda Proxxy agent üzerinden gitsin
+TRAFFIC_PROXIES = {"http": PROXY_URL, "https": PROXY_URL}
 
 # Test URL'leri - farklı content-type'lar için
 TEST_URLS = [
@@ -53,37 +76,208 @@ TEST_URLS = [
     }
 ]
 
+# Test URL'leri tek derlenmiş desenle aranır (her kayıt için TEST_URLS taranmaz)
+TEST_URL_PATTERN = re.compile("|".join(re.escape(t["url"]) for t in TEST_URLS))
+
+# GraphQL dokümanları bir kez tanımlanır
+Q_TOGGLE = """
+mutation ToggleInterception($enabled: Boolean!) {
+    toggleInterception(enabled: $enabled) {
+        enabled
+    }
+}
+"""
+
+# Sadece bu çalıştırmadaki httpbin istekleri; filtre sunucu tarafında uygulanır.
+# Header/body alanları toplu detay sorgusuna bırakılır.
+Q_LIST = """
+query GetHttpTransactions($since: Int) {
+    requests(agentId: null, urlContains: "httpbin.org", since: $since) {
+        requestId
+        url
+        status
+    }
+}
+"""
+
+# Toplu detay sorgusunda her alias için seçilen alanlar
+Q_DETAIL_FIELDS = "requestId method url status requestHeaders requestBody responseHeaders responseBody timestamp"
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Log'lanan body önizlemesinin azami uzunluğu
+PREVIEW_CUTOFF = 200
+
+# HTML/XML tespiti için gövdenin yalnızca başı incelenir
+MARKUP_PREFIX = re.compile(r"\s*<(!doctype|html|\?xml)", re.I)
+
+# Değişkenleri sabit olan gövde önceden serialize edilir
+PAYLOAD_DISABLE_INTERCEPTION = _json_dumps({"query": Q_TOGGLE, "variables": {"enabled": False}})
+
 class ResponseBodyCaptureTest:
     def __init__(self):
         self.orchestrator_process: Optional[subprocess.Popen] = None
         self.proxy_agent_process: Optional[subprocess.Popen] = None
         self.captured_requests = []
+        self.start_ts: Optional[int] = None
+        # log() zaman damgası saniyede bir yeniden formatlanır
+        self._last_sec = 0
+        self._last_stamp = ""
+        # --verbose: süreç çıktıları pipe'tan arka planda okunup bellekte tutulur.
+        # Aksi halde doğrudan /tmp altındaki log dosyalarına yazılır.
+        self.verbose = "--verbose" in sys.argv
+        self._output: Dict[str, List[List[str]]] = {}
+        self._drain_threads: Dict[str, List[threading.Thread]] = {}
+        self._log_files: Dict[str, Any] = {}
+        # Yerel GraphQL/probe istekleri: geçici hatalar urllib3 içinde backoff ile tekrar denenir.
+        # Varsayılan allowed_methods POST'u kapsamaz; mutation'lar sadece bağlantı
+        # kurulamadığında (istek hiç gönderilmeden) tekrarlanır.
+        self.session = requests.Session()
+        retry = Retry(total=5, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+        self.session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+        # Proxy üzerinden giden test trafiği asla tekrar denenmez: tekrar, yakalanan
+        # kayıtları çoğaltır ve testin raporlaması gereken proxy hatalarını gizler.
+        self.traffic_session = requests.Session()
+        self.traffic_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
         
     def log(self, message: str, level: str = "INFO"):
         """Log mesajı timestamp ile"""
-        timestamp = time.strftime("%H:%M:%S")
-        print(f"[{timestamp}] {level}: {message}")
+        sec = int(time.time())
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_stamp = time.strftime("%H:%M:%S", time.localtime(sec))
+        sys.stdout.write(f"[{self._last_stamp}] {level}: {message}\n")
         
     def graphql_query(self, query: str, variables: Optional[Dict] = None) -> Dict[Any, Any]:
         """GraphQL sorgusu çalıştır"""
-        payload = {
+        return self.graphql_query_raw(_json_dumps({
             "query": query,
             "variables": variables or {}
-        }
+        }))
         
+    def graphql_query_raw(self, body: bytes) -> Dict[Any, Any]:
+        """Önceden serialize edilmiş GraphQL gövdesini gönder"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 GRAPHQL_URL,
-                json=payload,
-                headers={"Content-Type": "application/json"},
+                data=body,
+                headers=JSON_HEADERS,
+                proxies=NO_PROXY,
                 timeout=10
             )
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except requests.exceptions.RequestException as e:
             self.log(f"GraphQL isteği başarısız: {e}", "ERROR")
             raise
             
+    @staticmethod
+    def _drain(stream, buf: List[str]):
+        """Pipe'ı kapanana kadar satır satır oku"""
+        for line in iter(stream.readline, ''):
+            buf.append(line)
+        stream.close()
+        
+    def _start_drain(self, name: str, process: subprocess.Popen):
+        """stdout ve stderr için birer okuyucu thread başlat"""
+        buffers = [[], []]
+        threads = [
+            threading.Thread(target=self._drain, args=(stream, buf), daemon=True)
+            for stream, buf in zip((process.stdout, process.stderr), buffers)
+        ]
+        for t in threads:
+            t.start()
+        self._output[name] = buffers
+        self._drain_threads[name] = threads
+        
+    def _spawn(self, name: str, cmd: List[str], env: Optional[Dict[str, str]] = None) -> subprocess.Popen:
+        """Servisi başlat; çıktı --verbose'a göre pipe'a ya da log dosyasına gider"""
+        if self.verbose:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                close_fds=True,
+                start_new_session=True,
+                env=env
+            )
+            self._start_drain(name, process)
+            return process
+            
+        log_file = open(f"/tmp/proxxy_{name.lower().replace(' ', '_')}.log", "wb")
+        self._log_files[name] = log_file
+        return subprocess.Popen(
+            cmd,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            close_fds=True,
+            start_new_session=True,
+            env=env
+        )
+        
+    def _dump_output(self, name: str, limit: int = 4096):
+        """Servis çıktısını logla; dosya modunda sadece son `limit` byte okunur"""
+        if self.verbose:
+            for t in self._drain_threads.get(name, ()):
+                t.join(timeout=1)
+            out, err = self._output.get(name, ([], []))
+            self.log(f"{name} STDOUT: {''.join(out)}", "ERROR")
+            self.log(f"STDERR: {''.join(err)}", "ERROR")
+            return
+            
+        log_file = self._log_files.get(name)
+        if log_file is None:
+            return
+        log_file.flush()
+        with open(log_file.name, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            f.seek(max(0, size - limit))
+            tail = f.read().decode("utf-8", "replace")
+        self.log(f"{name} log ({log_file.name}, son {limit // 1024}KB):\n{tail}", "ERROR")
+        
+    def _wait_ready(self, name: str, process: subprocess.Popen, probe_fn: Callable[[], bool],
+                    timeout: float = 20.0, initial: float = 0.05) -> bool:
+        """probe_fn başarılı olana kadar artan aralıklarla yokla; süreç ölürse hemen vazgeç"""
+        sys.stdout.flush()
+        deadline = time.monotonic() + timeout
+        n = 0
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                # Çıktının sonu cleanup() sırasında gösterilir
+                self.log(f"{name} erken kapandı (exit code: {process.returncode})", "ERROR")
+                return False
+            if probe_fn():
+                return True
+            time.sleep(min(initial * 2 ** n, 0.5))
+            n += 1
+        self.log(f"{name} {timeout:.0f} saniye içinde hazır olmadı", "ERROR")
+        return False
+        
+    @staticmethod
+    def _tcp_ready(host: str, port: int, timeout: float = 0.1) -> bool:
+        """Port dinleniyor mu? (localhost'ta HTTP isteğinden çok daha ucuz)"""
+        try:
+            socket.create_connection((host, port), timeout).close()
+            return True
+        except OSError:
+            return False
+            
+    def _probe_graphql(self) -> bool:
+        """Port açıldıktan sonra GraphQL handler'ın yanıt verdiğini doğrula"""
+        if not self._tcp_ready("127.0.0.1", 9090):
+            return False
+        try:
+            response = self.session.get(GRAPHQL_URL, proxies=NO_PROXY, timeout=0.5)
+            return response.status_code in (200, 405)
+        except requests.exceptions.RequestException:
+            return False
+            
+    def _probe_proxy(self) -> bool:
+        """Proxy'nin hazır olması için dinleme portunun açık olması yeterli"""
+        return self._tcp_ready("127.0.0.1", 9095)
+        
     def start_orchestrator(self) -> bool:
         """Orchestrator'ı başlat"""
         self.log("Orchestrator başlatılıyor...")
@@ -105,42 +299,14 @@ class ResponseBodyCaptureTest:
             cmd = [ORCHESTRATOR_BINARY, "--project", TEST_PROJECT_NAME]
             self.log(f"Komut çalıştırılıyor: {' '.join(cmd)}")
             
-            self.orchestrator_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
+            self.orchestrator_process = self._spawn("Orchestrator", cmd)
             self.log(f"Orchestrator başlatıldı (PID: {self.orchestrator_process.pid})")
             
-            # Başlatma için bekle
-            for i in range(10):
-                time.sleep(1)
-                if self.orchestrator_process.poll() is not None:
-                    stdout, stderr = self.orchestrator_process.communicate()
-                    self.log(f"Orchestrator erken kapandı. STDOUT: {stdout}", "ERROR")
-                    self.log(f"STDERR: {stderr}", "ERROR")
-                    return False
-                print(".", end="", flush=True)
-            print()
-            
             # GraphQL endpoint kontrolü
             self.log("GraphQL endpoint kontrol ediliyor...")
-            for attempt in range(5):
-                try:
-                    response = requests.get(f"http://127.0.0.1:9090/graphql", timeout=2)
-                    if response.status_code in [200, 405]:
-                        self.log("✅ GraphQL endpoint hazır")
-                        return True
-                except requests.exceptions.RequestException:
-                    if attempt < 4:
-                        self.log(f"GraphQL endpoint hazır değil, tekrar deneniyor... ({attempt + 1}/5)")
-                        time.sleep(2)
-                    else:
-                        self.log("GraphQL endpoint 5 denemeden sonra yanıt vermedi", "ERROR")
-                        return False
-                        
+            if not self._wait_ready("Orchestrator", self.orchestrator_process, self._probe_graphql):
+                return False
+            self.log("✅ GraphQL endpoint hazır")
             return True
             
         except Exception as e:
@@ -159,15 +325,14 @@ class ResponseBodyCaptureTest:
                 return False
                 
             # Environment variables ile body capture konfigürasyonu
-            env = os.environ.copy()
-            env.update({
+            overrides = {
                 "PROXXY_BODY_CAPTURE_ENABLED": "true",
                 "PROXXY_MAX_BODY_SIZE": "1048576",  # 1MB
                 "PROXXY_MEMORY_LIMIT": "10485760",  # 10MB
                 "PROXXY_RESPONSE_TIMEOUT": "30",
                 "PROXXY_STREAM_TIMEOUT": "5",
                 "PROXXY_CONTENT_TYPE_MODE": "capture_all"  # Tüm content-type'ları yakala
-            })
+            }
             
             # Proxy agent'ı başlat
             cmd = [
@@ -177,52 +342,17 @@ class ResponseBodyCaptureTest:
             ]
             self.log(f"Komut çalıştırılıyor: {' '.join(cmd)}")
             self.log("Environment variables:")
-            for key, value in env.items():
-                if key.startswith("PROXXY_"):
-                    self.log(f"  {key}={value}")
-            
-            self.proxy_agent_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                env=env
-            )
+            for key, value in overrides.items():
+                self.log(f"  {key}={value}")
             
+            self.proxy_agent_process = self._spawn("Proxy Agent", cmd, {**os.environ, **overrides})
             self.log(f"Proxy Agent başlatıldı (PID: {self.proxy_agent_process.pid})")
             
-            # Başlatma için bekle
-            for i in range(10):
-                time.sleep(1)
-                if self.proxy_agent_process.poll() is not None:
-                    stdout, stderr = self.proxy_agent_process.communicate()
-                    self.log(f"Proxy Agent erken kapandı. STDOUT: {stdout}", "ERROR")
-                    self.log(f"STDERR: {stderr}", "ERROR")
-                    return False
-                print(".", end="", flush=True)
-            print()
-            
             # Proxy endpoint kontrolü
             self.log("Proxy endpoint kontrol ediliyor...")
-            for attempt in range(5):
-                try:
-                    # Proxy'ye basit bir health check isteği gönder
-                    response = requests.get(
-                        "http://httpbin.org/status/200",
-                        proxies={"http": PROXY_URL, "https": PROXY_URL},
-                        timeout=5
-                    )
-                    if response.status_code == 200:
-                        self.log("✅ Proxy Agent hazır ve çalışıyor")
-                        return True
-                except requests.exceptions.RequestException:
-                    if attempt < 4:
-                        self.log(f"Proxy endpoint hazır değil, tekrar deneniyor... ({attempt + 1}/5)")
-                        time.sleep(2)
-                    else:
-                        self.log("Proxy endpoint 5 denemeden sonra yanıt vermedi", "ERROR")
-                        return False
-                        
+            if not self._wait_ready("Proxy Agent", self.proxy_agent_process, self._probe_proxy):
+                return False
+            self.log("✅ Proxy Agent hazır ve çalışıyor")
             return True
             
         except Exception as e:
@@ -234,15 +364,7 @@ class ResponseBodyCaptureTest:
         self.log("Interception kapatılıyor...")
         
         try:
-            mutation = """
-            mutation ToggleInterception($enabled: Boolean!) {
-                toggleInterception(enabled: $enabled) {
-                    enabled
-                }
-            }
-            """
-            
-            result = self.graphql_query(mutation, {"enabled": False})
+            result = self.graphql_query_raw(PAYLOAD_DISABLE_INTERCEPTION)
             
             if "errors" in result:
                 self.log(f"GraphQL hataları: {result['errors']}", "ERROR")
@@ -261,73 +383,92 @@ class ResponseBodyCaptureTest:
             self.log(f"Interception kapatılamadı: {e}", "ERROR")
             return False
             
+    def _fetch(self, test_case: Dict[str, str], i: int) -> bool:
+        """Tek bir test URL'ini proxy üzerinden iste"""
+        tag = f"[{i+1}/{len(TEST_URLS)}]"
+        self.log(f"Test {tag}: {test_case['description']} - {test_case['url']}")
+        
+        try:
+            response = self.traffic_session.get(
+                test_case['url'],
+                proxies=TRAFFIC_PROXIES,
+                timeout=15,
+                stream=True,
+                headers={
+                    "User-Agent": "Proxxy-ResponseBody-Test/1.0",
+                    "X-Test-Case": test_case['description'],
+                    "X-Test-Index": str(i),
+                    "X-Test-Timestamp": str(int(time.time()))
+                }
+            )
+            
+            # Body bellekte tutulmaz ama sonuna kadar okunur: proxy'nin yanıtı
+            # eksiksiz aktarması (ve yakalaması) için bağlantı yarıda kesilmemeli.
+            size = response.headers.get("Content-Length")
+            drained = sum(len(chunk) for chunk in response.iter_content(65536))
+            response.close()
+            
+            if response.status_code == 200:
+                self.log(f"  {tag} ✅ Başarılı (status: {response.status_code}, size: {size or drained} bytes)")
+                return True
+            self.log(f"  {tag} ⚠️  Beklenmeyen status: {response.status_code}")
+            
+        except Exception as e:
+            self.log(f"  {tag} ❌ Hata: {e}", "ERROR")
+            
+        return False
+        
     def generate_test_traffic(self) -> bool:
         """Test trafiği oluştur"""
         self.log("Test trafiği oluşturuluyor...")
         
-        proxies = {
-            'http': PROXY_URL,
-            'https': PROXY_URL
-        }
-        
-        success_count = 0
-        
-        for i, test_case in enumerate(TEST_URLS):
-            self.log(f"Test {i+1}/{len(TEST_URLS)}: {test_case['description']}")
-            self.log(f"  URL: {test_case['url']}")
-            
-            try:
-                response = requests.get(
-                    test_case['url'],
-                    proxies=proxies,
-                    timeout=15,
-                    headers={
-                        "User-Agent": "Proxxy-ResponseBody-Test/1.0",
-                        "X-Test-Case": test_case['description'],
-                        "X-Test-Index": str(i),
-                        "X-Test-Timestamp": str(int(time.time()))
-                    }
-                )
-                
-                if response.status_code == 200:
-                    self.log(f"  ✅ Başarılı (status: {response.status_code}, size: {len(response.content)} bytes)")
-                    success_count += 1
-                else:
-                    self.log(f"  ⚠️  Beklenmeyen status: {response.status_code}")
-                    
-            except Exception as e:
-                self.log(f"  ❌ Hata: {e}", "ERROR")
-                
-            time.sleep(2)  # İstekler arası bekleme
+        # İstekler eşzamanlı gönderilir; proxy'nin concurrency yolu da test edilmiş olur
+        with ThreadPoolExecutor(max_workers=len(TEST_URLS)) as ex:
+            futures = [ex.submit(self._fetch, tc, i) for i, tc in enumerate(TEST_URLS)]
+            success_count = sum(f.result() for f in futures)
             
         self.log(f"Trafik oluşturma tamamlandı: {success_count}/{len(TEST_URLS)} başarılı")
         
         # Trafiğin işlenmesi için bekle
         self.log("Trafiğin işlenmesi için bekleniyor...")
-        time.sleep(10)
+        sys.stdout.flush()
+        self._wait_for_captures({t["url"] for t in TEST_URLS})
         
         return success_count > 0
         
+    def _wait_for_captures(self, expected_urls, timeout: float = 10.0) -> bool:
+        """Beklenen URL'lerin hepsi yanıtlarıyla birlikte kaydedilene kadar liste sorgusunu yokla"""
+        deadline = time.monotonic() + timeout
+        delay = 0.2
+        while True:
+            try:
+                result = self.graphql_query(Q_LIST, {"since": self.start_ts})
+                # Satır istek gelince yazılır, status/body ise Response event'iyle
+                # ayrı bir UPDATE'te dolar; status'u olmayan kayıt henüz hazır değil
+                seen = {
+                    m.group(0)
+                    for req in (result.get("data") or {}).get("requests") or []
+                    if req.get("status") is not None
+                    and (m := TEST_URL_PATTERN.search(req.get("url") or ""))
+                }
+                if expected_urls <= seen:
+                    return True
+            except Exception:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.log("⚠️  Tüm test istekleri zamanında kaydedilmedi, doğrulamaya geçiliyor")
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
+            
     def verify_response_body_capture(self) -> bool:
         """Response body capture'ın çalışıp çalışmadığını kontrol et"""
         self.log("Response body capture kontrol ediliyor...")
         
         try:
-            # HTTP transaction'ları al
-            query = """
-            query GetHttpTransactions {
-                requests(agentId: null) {
-                    requestId
-                    method
-                    url
-                    status
-                    timestamp
-                }
-            }
-            """
-            
             self.log("HTTP transaction'ları sorgulanıyor...")
-            result = self.graphql_query(query)
+            result = self.graphql_query(Q_LIST, {"since": self.start_ts})
             
             if "errors" in result:
                 self.log(f"GraphQL hataları: {result['errors']}", "ERROR")
@@ -341,11 +482,10 @@ class ResponseBodyCaptureTest:
                 return False
                 
             # Test isteklerimizi bul
-            test_requests = []
-            for req in requests_list:
-                url = req.get("url", "")
-                if "httpbin.org" in url and any(test_url["url"] in url for test_url in TEST_URLS):
-                    test_requests.append(req)
+            test_requests = [
+                req for req in requests_list
+                if TEST_URL_PATTERN.search(req.get("url") or "")
+            ]
                     
             self.log(f"{len(test_requests)} test isteği bulundu")
             
@@ -356,6 +496,23 @@ class ResponseBodyCaptureTest:
                     self.log(f"  - {req.get('url', 'N/A')}")
                 return False
                 
+            # Tüm detayları alias'lı tek bir sorguyla al
+            params = ", ".join(f"$id{i}: String!" for i in range(len(test_requests)))
+            fragments = "\n".join(
+                f"r{i}: request(id: $id{i}) {{ {Q_DETAIL_FIELDS} }}"
+                for i in range(len(test_requests))
+            )
+            detail_query = f"query GetRequestDetails({params}) {{\n{fragments}\n}}"
+            variables = {f"id{i}": req["requestId"] for i, req in enumerate(test_requests)}
+
+            detail_result = self.graphql_query(detail_query, variables)
+
+            # Hatalı alias'lar null döner; diğer istekler yine kontrol edilir
+            if "errors" in detail_result:
+                self.log(f"❌ Detay sorgusu hataları: {detail_result['errors']}", "ERROR")
+
+            details = detail_result.get("data") or {}
+
             # Her test isteği için detaylı kontrol
             success_count = 0
             
@@ -366,30 +523,7 @@ class ResponseBodyCaptureTest:
                 self.log(f"  URL: {req.get('url', 'N/A')}")
                 self.log(f"  Status: {req.get('status', 'N/A')}")
                 
-                # Detaylı bilgileri al
-                detail_query = """
-                query GetRequestDetail($id: String!) {
-                    request(id: $id) {
-                        requestId
-                        method
-                        url
-                        status
-                        requestHeaders
-                        requestBody
-                        responseHeaders
-                        responseBody
-                        timestamp
-                    }
-                }
-                """
-                
-                detail_result = self.graphql_query(detail_query, {"id": request_id})
-                
-                if "errors" in detail_result:
-                    self.log(f"  ❌ Detay sorgusu başarısız: {detail_result['errors']}", "ERROR")
-                    continue
-                    
-                request_detail = detail_result.get("data", {}).get("request")
+                request_detail = details.get(f"r{i}")
                 
                 if not request_detail:
                     self.log(f"  ❌ İstek detayı bulunamadı", "ERROR")
@@ -411,30 +545,35 @@ class ResponseBodyCaptureTest:
                     self.log(f"  ❌ Response body null!")
                     
                 # 2. Response body boş değil mi?
-                if response_body and len(response_body.strip()) > 0:
+                # isspace() kopya üretmez ve ilk boşluk olmayan karakterde durur
+                if response_body and not response_body.isspace():
                     self.log(f"  ✅ Response body boş değil (uzunluk: {len(response_body)} karakter)")
                     checks_passed += 1
                 else:
                     self.log(f"  ❌ Response body boş!")
                     
                 # 3. Response headers var mı?
-                if response_headers and len(response_headers.strip()) > 0:
+                if response_headers and not response_headers.isspace():
                     self.log(f"  ✅ Response headers mevcut (uzunluk: {len(response_headers)} karakter)")
                     checks_passed += 1
                 else:
                     self.log(f"  ❌ Response headers boş!")
                     
                 # 4. JSON response ise parse edilebilir mi?
+                # Capture'ın eksiksiz olduğunu kanıtlamak için JSON gövdeler her zaman
+                # tam parse edilir (gövdeler PROXXY_MAX_BODY_SIZE ile sınırlı)
                 json_parseable = False
-                if response_body and response_body.strip().startswith('{'):
+                head = response_body[:64].lstrip() if response_body else ""
+                declared_json = bool(response_headers) and "application/json" in response_headers
+                if head.startswith(('{', '[')) or (response_body and declared_json):
                     try:
-                        json.loads(response_body)
+                        _json_loads(response_body)
                         self.log(f"  ✅ Response body geçerli JSON")
                         json_parseable = True
                         checks_passed += 1
                     except json.JSONDecodeError:
                         self.log(f"  ⚠️  Response body JSON gibi görünüyor ama parse edilemiyor")
-                elif response_body and ("<html" in response_body.lower() or "<?xml" in response_body.lower()):
+                elif head and MARKUP_PREFIX.match(head):
                     self.log(f"  ✅ Response body HTML/XML içeriği")
                     checks_passed += 1
                 else:
@@ -452,7 +591,8 @@ class ResponseBodyCaptureTest:
                     
                 # İlk birkaç karakteri göster (debug için)
                 if response_body:
-                    preview = response_body[:200] + "..." if len(response_body) > 200 else response_body
+                    preview = (response_body if len(response_body) <= PREVIEW_CUTOFF
+                               else f"{response_body[:PREVIEW_CUTOFF]}...")
                     self.log(f"  📄 Response body önizleme: {preview}")
                     
             # Genel sonuç
@@ -475,45 +615,61 @@ class ResponseBodyCaptureTest:
             self.log(f"Response body capture kontrolü başarısız: {e}", "ERROR")
             return False
             
-    def cleanup(self):
+    @staticmethod
+    def _kill_group(process: subprocess.Popen, grace: float = 2.0) -> bool:
+        """Sürecin grubunu SIGTERM ile kapat, grace süresinde kapanmazsa SIGKILL gönder.
+        Nazikçe kapandıysa (ya da zaten kapanmışsa) True döner."""
+        # Zaten reap edilmiş bir sürecin pid'i yeniden kullanılmış olabilir;
+        # böyle bir gruba sinyal gönderilmez.
+        if process.poll() is not None:
+            return True
+        # start_new_session=True ile başlatıldığı için pgid == pid
+        pgid = process.pid
+        try:
+            os.killpg(pgid, signal.SIGTERM)
+            process.wait(timeout=grace)
+            return True
+        except subprocess.TimeoutExpired:
+            os.killpg(pgid, signal.SIGKILL)
+            process.wait()
+            return False
+        except ProcessLookupError:
+            process.wait()
+            return True
+            
+    def cleanup(self, dump_logs: bool = False):
         """Kaynakları temizle"""
         self.log("Temizlik yapılıyor...")
         
-        # Proxy Agent'ı kapat
-        if self.proxy_agent_process:
+        # Proxy Agent önce, Orchestrator sonra kapatılır
+        for name, process in (("Proxy Agent", self.proxy_agent_process),
+                              ("Orchestrator", self.orchestrator_process)):
+            if not process:
+                continue
             try:
-                self.log(f"Proxy Agent kapatılıyor (PID: {self.proxy_agent_process.pid})")
-                self.proxy_agent_process.terminate()
-                try:
-                    self.proxy_agent_process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    self.log("Proxy Agent zorla kapatılıyor...")
-                    self.proxy_agent_process.kill()
-                    self.proxy_agent_process.wait()
-                self.log("Proxy Agent kapatıldı")
+                self.log(f"{name} kapatılıyor (PID: {process.pid})")
+                if not self._kill_group(process):
+                    self.log(f"{name} zorla kapatıldı")
+                self.log(f"{name} kapatıldı")
             except Exception as e:
-                self.log(f"Proxy Agent kapatma hatası: {e}", "ERROR")
+                self.log(f"{name} kapatma hatası: {e}", "ERROR")
                 
-        # Orchestrator'ı kapat
-        if self.orchestrator_process:
-            try:
-                self.log(f"Orchestrator kapatılıyor (PID: {self.orchestrator_process.pid})")
-                self.orchestrator_process.terminate()
-                try:
-                    self.orchestrator_process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    self.log("Orchestrator zorla kapatılıyor...")
-                    self.orchestrator_process.kill()
-                    self.orchestrator_process.wait()
-                self.log("Orchestrator kapatıldı")
-            except Exception as e:
-                self.log(f"Orchestrator kapatma hatası: {e}", "ERROR")
+        # Başarısız çalıştırmada servis çıktılarının sonunu göster
+        if dump_logs:
+            for name in ("Orchestrator", "Proxy Agent"):
+                self._dump_output(name)
+        for log_file in self._log_files.values():
+            log_file.close()
+            
+        self.session.close()
+        self.traffic_session.close()
                 
     def run(self) -> bool:
         """Tam integration testi çalıştır"""
         self.log("🚀 Response Body Capture Integration Test Başlıyor")
         self.log("=" * 60)
         
+        success = False
         try:
             # Adım 1: Orchestrator'ı başlat
             if not self.start_orchestrator():
@@ -528,6 +684,8 @@ class ResponseBodyCaptureTest:
                 return False
                 
             # Adım 4: Test trafiği oluştur
+            # req_timestamp saniye çözünürlüğünde saklanır
+            self.start_ts = int(time.time())
             if not self.generate_test_traffic():
                 return False
                 
@@ -535,6 +693,7 @@ class ResponseBodyCaptureTest:
             if not self.verify_response_body_capture():
                 return False
                 
+            success = True
             return True
             
         except KeyboardInterrupt:
@@ -544,7 +703,7 @@ class ResponseBodyCaptureTest:
             self.log(f"Test sırasında beklenmeyen hata: {e}", "ERROR")
             return False
         finally:
-            self.cleanup()
+            self.cleanup(dump_logs=not success)
             
 def main():
     """Ana giriş noktası"""